@@ -77,6 +77,9 @@ with st.sidebar:
 
     if st.button("Refresh Data", use_container_width=True):
         st.cache_data.clear()
+        # Expire the roast widget's stored profile so the next roast refetches too
+        if st.session_state.get('roast_data'):
+            st.session_state.roast_data.pop('fetched_at', None)
     github_token = st.text_input("GitHub Token (optional)", type="password")
         
     st.info("💡 Tip: Use the 'Badges' tab to add your tech stack icons!")
@@ -108,7 +111,9 @@ def render_tab(svg_bytes, endpoint, username, selected_theme, custom_colors, hid
     col1, col2 = st.columns([1.5, 1])
     with col1:
         # Render SVG
-        b64 = base64.b64encode(svg_bytes.encode('utf-8')).decode("utf-8")
+        if isinstance(svg_bytes, str):
+            svg_bytes = svg_bytes.encode('utf-8')
+        b64 = base64.b64encode(svg_bytes).decode("utf-8")
         st.markdown(f'<img src="data:image/svg+xml;base64,{b64}" style="max-width: 100%; box-shadow: 0 4px 6px rgba(0,0,0,0.3); border-radius: 10px;"/>', unsafe_allow_html=True)
 
     with col2:
@@ -178,6 +183,14 @@ with tab2:
     # Generate card with exclusions - FIXED: Pass current_theme_opts
     svg_bytes = lang_card.draw_lang_card(data, current_theme_opts, custom_colors, excluded_languages=excluded_languages)
     render_tab(svg_bytes, "languages", username, selected_theme, custom_colors, code_template="![Top Langs]({url})", excluded_languages=excluded_languages_str)
+    
+    # Gzip-compressed download; use the Integration link above for README embedding
+    st.download_button(
+        label="💾 Download SVGZ (compressed)",
+        data=lang_card.draw_lang_card_gzipped(data, current_theme_opts, custom_colors, excluded_languages=excluded_languages),
+        file_name=f"{username}_lang.svgz",
+        mime="image/svg+xml"
+    )
 
 with tab3:
     st.subheader("Contribution Graph")
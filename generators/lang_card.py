@@ -1,8 +1,38 @@
-import svgwrite
+import gzip
 import math
+from functools import lru_cache
+from xml.sax.saxutils import escape
 from themes.styles import THEMES
 from .svg_base import create_svg_base
 
+# Static SVG fragments, built once at import; only per-card values are interpolated
+_SVG_NAMESPACES = (
+    'xmlns="http://www.w3.org/2000/svg" xmlns:ev="http://www.w3.org/2001/xml-events" '
+    'xmlns:xlink="http://www.w3.org/1999/xlink"'
+)
+_FILL_ANIMATION = (
+    '<animate attributeName="width" begin="0s" calcMode="spline" dur="1s" fill="freeze" '
+    'keySplines="0.445 0.05 0.55 0.95" keyTimes="0;1" values="0;'
+)
+
+# Theme keys used by this card, in the order the renderer unpacks them
+_THEME_FIELDS = (
+    "bg_color", "border_color", "title_color", "text_color",
+    "font_family", "title_font_size", "text_font_size",
+)
+
+
+def _esc(value):
+    """Escape a value for use in SVG text or a double-quoted attribute."""
+    return escape(str(value), {'"': "&quot;"})
+
+
+def _bar_metrics(counts, bar_width):
+    """Returns (percentage, fill width) pairs for the given language counts."""
+    total = sum(counts) or 1
+    return [(share * 100, share * bar_width) for share in (count / total for count in counts)]
+
+
 def draw_lang_card(data, theme_name="Default", custom_colors=None, excluded_languages=None):
     """
     Generates the Top Languages Card SVG.
@@ -12,6 +42,8 @@ def draw_lang_card(data, theme_name="Default", custom_colors=None, excluded_lang
         theme_name: string key from THEMES
         custom_colors: dict with custom color overrides
         excluded_languages: list of language names to exclude (case-insensitive)
+    
+    Returns: SVG document as UTF-8 encoded bytes
     """
     # FIXED: Handle both string theme name and pre-resolved theme dict
     if isinstance(theme_name, dict):
@@ -25,14 +57,35 @@ def draw_lang_card(data, theme_name="Default", custom_colors=None, excluded_lang
         if custom_colors:
             theme.update(custom_colors)
 
+    # Canonicalize inputs into hashable tuples so identical cards hit the cache
+    langs_key = tuple((lang, count) for lang, count in data.get("top_languages", []))
+    theme_key = tuple(theme[field] for field in _THEME_FIELDS)
+    excluded_key = tuple(sorted(lang.lower() for lang in (excluded_languages or [])))
+    return _draw_lang_card_cached(langs_key, theme_key, excluded_key)
+
+
+def draw_lang_card_gzipped(data, theme_name="Default", custom_colors=None, excluded_languages=None):
+    """
+    Generates the Top Languages Card as a gzip-compressed SVG (.svgz).
+    Takes the same arguments as draw_lang_card.
+    
+    Returns: gzip-compressed SVG bytes
+    """
+    svg_bytes = draw_lang_card(data, theme_name, custom_colors, excluded_languages=excluded_languages)
+    # mtime=0 keeps the gzip header stable so identical cards give identical bytes
+    return gzip.compress(svg_bytes, compresslevel=6, mtime=0)
+
+
+@lru_cache(maxsize=128)
+def _draw_lang_card_cached(langs, theme_values, excluded_languages):
+    """Renders the card from canonicalized inputs; see draw_lang_card."""
+
     width = 300
-    # Dynamic height based on languages (max 5)
-    langs = data.get("top_languages", [])
     
     # Apply exclusion filter if provided
     if excluded_languages and langs:
-        # Convert excluded languages to lowercase for case-insensitive matching
-        excluded_lower = [lang.lower() for lang in excluded_languages]
+        # Excluded languages are already lowercased for case-insensitive matching
+        excluded_lower = frozenset(excluded_languages)
         langs = [
             (lang, count) 
             for lang, count in langs 
@@ -47,66 +100,49 @@ def draw_lang_card(data, theme_name="Default", custom_colors=None, excluded_lang
     header_height = 40
     height = header_height + (len(langs) * item_height) + 10
     
-    dwg = svgwrite.Drawing(size=("100%", "100%"), viewBox=f"0 0 {width} {height}")
-    
-    # Background
-    dwg.add(dwg.rect(insert=(0, 0), size=("100%", "100%"), rx=10, ry=10, 
-                     fill=theme["bg_color"], stroke=theme["border_color"], stroke_width=2))
+    # Unpack the flattened theme (escaped once) into locals
+    (bg_color, border_color, title_color, text_color,
+     font_family, title_font, text_font) = map(_esc, theme_values)
+    bar_width = width - 40
+    pct_x = width - 20
     
-    # Title
-    dwg.add(dwg.text("Top Languages", insert=(20, 30), 
-                     fill=theme["title_color"], font_size=theme["title_font_size"], 
-                     font_family=theme["font_family"], font_weight="bold"))
+    # Emit the SVG as raw strings; a single join avoids svgwrite's element tree
+    parts = [
+        f'<svg baseProfile="full" height="100%" version="1.1" viewBox="0 0 {width} {height}" width="100%" '
+        f'{_SVG_NAMESPACES}><defs />',
+        # Background
+        f'<rect fill="{bg_color}" height="100%" rx="10" ry="10" '
+        f'stroke="{border_color}" stroke-width="2" width="100%" x="0" y="0" />',
+        # Title
+        f'<text fill="{title_color}" font-family="{font_family}" '
+        f'font-size="{title_font}" font-weight="bold" x="20" y="30">Top Languages</text>',
+    ]
     
     # Content
     start_y = 60
     
-    # Calculate total for percentages
-    total_usage = sum(count for _, count in langs)
-    if total_usage == 0: total_usage = 1
+    # Calculate percentages and bar fill widths in one pass
+    metrics = _bar_metrics([count for _, count in langs], bar_width)
     
-    for i, (lang, count) in enumerate(langs):
+    for i, ((lang, _), (pct, fill_width)) in enumerate(zip(langs, metrics)):
         y = start_y + (i * item_height)
-        pct = (count / total_usage) * 100
-        
-        # Label
-        dwg.add(dwg.text(lang, insert=(20, y), fill=theme["text_color"], 
-                         font_size=theme["text_font_size"], font_family=theme["font_family"]))
-        
-        # Percentage Text
-        dwg.add(dwg.text(f"{pct:.1f}%", insert=(width - 20, y), fill=theme["text_color"], 
-                         font_size=theme["text_font_size"], font_family=theme["font_family"], text_anchor="end"))
-        
-        # Progress Bar Background
         bar_y = y + 5
-        bar_width = width - 40
-        dwg.add(dwg.rect(insert=(20, bar_y), size=(bar_width, 6), rx=3, ry=3, fill=theme["border_color"], opacity=0.3))
-        
-        # Progress Bar Fill with sine wave animation
-        fill_width = (pct / 100) * bar_width
-        bar_color = theme["title_color"]
         
-        # Create the progress bar fill
-        progress_fill = dwg.rect(
-            insert=(20, bar_y), 
-            size=(0, 6),  # Start with 0 width
-            rx=3, 
-            ry=3, 
-            fill=bar_color
+        parts.append(
+            # Label
+            f'<text fill="{text_color}" font-family="{font_family}" '
+            f'font-size="{text_font}" x="20" y="{y}">{_esc(lang)}</text>'
+            # Percentage Text
+            f'<text fill="{text_color}" font-family="{font_family}" '
+            f'font-size="{text_font}" text-anchor="end" x="{pct_x}" y="{y}">{pct:.1f}%</text>'
+            # Progress Bar Background
+            f'<rect fill="{border_color}" height="6" opacity="0.3" rx="3" ry="3" '
+            f'width="{bar_width}" x="20" y="{bar_y}" />'
+            # Progress Bar Fill with sine wave animation (starts at 0 width)
+            f'<rect fill="{title_color}" height="6" rx="3" ry="3" width="0" x="20" y="{bar_y}">'
+            f'{_FILL_ANIMATION}{fill_width:.1f}" /></rect>'
         )
         
-        # Add sine wave animation 
-        progress_fill.add(dwg.animate(
-            attributeName="width",
-            values="0;{0}".format(fill_width),
-            keyTimes="0;1",
-            calcMode="spline",
-            keySplines="0.445 0.05 0.55 0.95",  # Sine curve approximation
-            dur="1s",
-            begin="0s",
-            fill="freeze"
-        ))
-        
-        dwg.add(progress_fill)
-        
-    return dwg.tostring()
\ No newline at end of file
+    parts.append("</svg>")
+    # Encode once here so callers can send the bytes as-is
+    return "".join(parts).encode("utf-8")
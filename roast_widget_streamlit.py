@@ -5,10 +5,90 @@ Add this to your GitCanvas Streamlit app
 
 import streamlit as st
 import os
+import time
 from ai.ai_roast_service import generate_profile_roast
 from utils.github_utils import fetch_github_stats
 
 
+# Custom CSS for the widget, built once at import time
+_ROAST_CSS = """
+<style>
+.roast-widget {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    border-radius: 16px;
+    padding: 24px;
+    color: white;
+    margin: 20px 0;
+}
+.roast-header {
+    text-align: center;
+    font-size: 28px;
+    font-weight: 700;
+    margin-bottom: 10px;
+}
+.roast-subtitle {
+    text-align: center;
+    font-size: 14px;
+    opacity: 0.9;
+    margin-bottom: 20px;
+}
+.roast-text {
+    background: rgba(255, 255, 255, 0.15);
+    border-left: 4px solid #ffd700;
+    border-radius: 8px;
+    padding: 20px;
+    font-size: 20px;
+    font-weight: 500;
+    font-style: italic;
+    margin: 20px 0;
+    text-align: center;
+}
+.roast-stats {
+    display: flex;
+    justify-content: center;
+    gap: 30px;
+    margin-top: 20px;
+    padding-top: 20px;
+    border-top: 1px solid rgba(255, 255, 255, 0.2);
+}
+.stat {
+    text-align: center;
+}
+.stat-label {
+    font-size: 12px;
+    opacity: 0.8;
+    text-transform: uppercase;
+}
+.stat-value {
+    font-size: 16px;
+    font-weight: 700;
+}
+</style>
+"""
+
+
+# How long a fetched profile is reused before hitting GitHub again (seconds)
+_PROFILE_TTL = 600
+
+
+class _ProfileFetchError(Exception):
+    """Raised by _cached_fetch so failed fetches are not cached"""
+
+
+@st.cache_data(ttl=_PROFILE_TTL, show_spinner=False)
+def _cached_fetch(username: str):
+    """
+    Fetch GitHub stats, cached for 10 minutes per username (successes only)
+    
+    Returns:
+        (fetched_at, profile_data) where fetched_at is when GitHub was actually queried
+    """
+    profile_data = fetch_github_stats(username)
+    if not profile_data:
+        raise _ProfileFetchError(username)
+    return time.time(), profile_data
+
+
 def render_roast_widget(username: str):
     """
     Render the AI Roast widget in Streamlit
@@ -16,61 +96,8 @@ def render_roast_widget(username: str):
     Args:
         username: GitHub username to roast
     """
-    # Custom CSS for the widget
-    st.markdown("""
-    <style>
-    .roast-widget {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        border-radius: 16px;
-        padding: 24px;
-        color: white;
-        margin: 20px 0;
-    }
-    .roast-header {
-        text-align: center;
-        font-size: 28px;
-        font-weight: 700;
-        margin-bottom: 10px;
-    }
-    .roast-subtitle {
-        text-align: center;
-        font-size: 14px;
-        opacity: 0.9;
-        margin-bottom: 20px;
-    }
-    .roast-text {
-        background: rgba(255, 255, 255, 0.15);
-        border-left: 4px solid #ffd700;
-        border-radius: 8px;
-        padding: 20px;
-        font-size: 20px;
-        font-weight: 500;
-        font-style: italic;
-        margin: 20px 0;
-        text-align: center;
-    }
-    .roast-stats {
-        display: flex;
-        justify-content: center;
-        gap: 30px;
-        margin-top: 20px;
-        padding-top: 20px;
-        border-top: 1px solid rgba(255, 255, 255, 0.2);
-    }
-    .stat {
-        text-align: center;
-    }
-    .stat-label {
-        font-size: 12px;
-        opacity: 0.8;
-        text-transform: uppercase;
-    }
-    .stat-value {
-        font-size: 16px;
-        font-weight: 700;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    # Re-emit every run: Streamlit drops elements a rerun does not render
+    st.markdown(_ROAST_CSS, unsafe_allow_html=True)
     
     # Widget container
     with st.container():
@@ -90,8 +117,18 @@ def render_roast_widget(username: str):
             if st.button("🎭 Generate Roast", use_container_width=True, type="primary"):
                 with st.spinner("🔥 Cooking up a roast..."):
                     try:
-                        # Fetch GitHub stats
-                        profile_data = fetch_github_stats(username)
+                        # Reuse the profile from the last roast if it is for the same user and still fresh
+                        previous = st.session_state.roast_data
+                        if (previous and previous.get('username') == username
+                                and time.time() - previous.get('fetched_at', 0) < _PROFILE_TTL):
+                            profile_data = previous['profile']
+                            fetched_at = previous['fetched_at']
+                        else:
+                            # Fetch GitHub stats
+                            try:
+                                fetched_at, profile_data = _cached_fetch(username)
+                            except _ProfileFetchError:
+                                profile_data = None
                         
                         if profile_data:
                             # Generate roast
@@ -99,7 +136,9 @@ def render_roast_widget(username: str):
                             st.session_state.roast_data = {
                                 'roast': roast_result['roast'],
                                 'profile': profile_data,
-                                'source': roast_result['source']
+                                'source': roast_result['source'],
+                                'username': username,
+                                'fetched_at': fetched_at
                             }
                         else:
                             st.error("Failed to fetch GitHub profile data")
@@ -2,16 +2,86 @@
 GitHub API utilities for fetching profile data
 """
 
+import os
+import json
+import heapq
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Optional
 from collections import Counter
+try:
+    import orjson  # type: ignore
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 GITHUB_API_BASE = "https://api.github.com"
 
+# Shared session so repeated calls reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update({"Accept": "application/vnd.github.v3+json"})
+_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    # raise_on_status=False hands the final 5xx response back so raise_for_status() handles it
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504], raise_on_status=False)
+)
+_SESSION.mount("https://", _ADAPTER)
+
+# (connect, read) timeouts so a stalled connection fails fast instead of blocking the worker
+_TIMEOUT = (3.05, 10)
+
+# GraphQL profile query, serialized once; only the username varies per call
+_GRAPHQL_QUERY = """
+query($username: String!) {
+  user(login: $username) {
+    login
+    name
+    bio
+    avatarUrl
+    createdAt
+    followers {
+      totalCount
+    }
+    following {
+      totalCount
+    }
+    repositories(first: 30, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      totalCount
+      nodes {
+        name
+        primaryLanguage {
+          name
+        }
+        defaultBranchRef {
+          target {
+            ... on Commit {
+              history {
+                totalCount
+              }
+            }
+          }
+        }
+      }
+    }
+    contributionsCollection {
+      totalCommitContributions
+    }
+  }
+}
+"""
+_GRAPHQL_PAYLOAD_TEMPLATE = '{"query": ' + json.dumps(_GRAPHQL_QUERY) + ', "variables": {"username": %s}}'
+
+# Worker pool for overlapping the repos listing with the caller's own request
+_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
 
 def fetch_github_stats(username: str) -> Optional[Dict]:
     """
     Fetch comprehensive GitHub profile statistics
+    Uses a single GraphQL request when GITHUB_TOKEN is set, otherwise the REST API
     
     Args:
         username: GitHub username
@@ -19,52 +89,62 @@ def fetch_github_stats(username: str) -> Optional[Dict]:
     Returns:
         Dict with profile data or None if failed
     """
-    try:
-        # Fetch user profile
-        user_response = requests.get(
-            f"{GITHUB_API_BASE}/users/{username}",
-            headers={"Accept": "application/vnd.github.v3+json"}
-        )
-        
-        if user_response.status_code != 200:
-            print(f"Failed to fetch user: {user_response.status_code}")
-            return None
-        
-        user_data = user_response.json()
+    github_token = os.environ.get("GITHUB_TOKEN")
+    if github_token:
+        return fetch_github_stats_detailed(username, github_token)
+    return _fetch_github_stats_rest(username)
+
+
+def _fetch_github_stats_rest(username: str) -> Optional[Dict]:
+    """
+    Fetch GitHub profile statistics from the public REST API
+    
+    Args:
+        username: GitHub username
         
-        # Fetch user's repositories
-        repos_response = requests.get(
+    Returns:
+        Dict with profile data or None if failed
+    """
+    try:
+        # Fetch repositories in the background while this thread fetches the user profile
+        repos_future = _EXECUTOR.submit(
+            _SESSION.get,
             f"{GITHUB_API_BASE}/users/{username}/repos",
             params={
-                "per_page": 100,
+                "per_page": 30,  # Only the 30 most recent repos are used
                 "sort": "updated"
             },
-            headers={"Accept": "application/vnd.github.v3+json"}
+            timeout=_TIMEOUT
         )
+        user_response = _SESSION.get(f"{GITHUB_API_BASE}/users/{username}", timeout=_TIMEOUT)
+        repos_response = repos_future.result()
         
-        if repos_response.status_code != 200:
-            print(f"Failed to fetch repos: {repos_response.status_code}")
+        # GET 5xx responses were already retried by the session's Retry policy
+        user_response.raise_for_status()
+        user_data = _json_loads(user_response.content)
+        
+        try:
+            repos_response.raise_for_status()
+            repos = _json_loads(repos_response.content)
+        except requests.HTTPError as e:
+            print(f"Failed to fetch repos: {e}")
             repos = []
-        else:
-            repos = repos_response.json()
         
         # Calculate language statistics
-        language_counts = Counter()
-        total_commits_estimate = 0
+        language_counts = Counter(repo['language'] for repo in repos if repo.get('language'))
         
-        for repo in repos[:30]:  # Limit to 30 most recent repos
-            if repo.get('language'):
-                language_counts[repo['language']] += 1
-            
-            # Estimate commits (this is approximate)
-            # For better accuracy, would need to query each repo's commit endpoint
-            if not repo.get('fork'):  # Don't count forked repos
-                total_commits_estimate += repo.get('size', 0) // 10  # Rough estimate
+        # Estimate commits (this is approximate)
+        # For better accuracy, would need to query each repo's commit endpoint
+        total_commits_estimate = sum(
+            repo.get('size', 0) // 10  # Rough estimate
+            for repo in repos
+            if not repo.get('fork')  # Don't count forked repos
+        )
         
         # Get top languages
         top_languages = [
             {"name": lang, "count": count}
-            for lang, count in language_counts.most_common(5)
+            for lang, count in heapq.nlargest(5, language_counts.items(), key=lambda kv: kv[1])
         ]
         
         # Construct profile data
@@ -83,6 +163,9 @@ def fetch_github_stats(username: str) -> Optional[Dict]:
         
         return profile_data
         
+    except requests.HTTPError as e:
+        print(f"Failed to fetch user: {e}")
+        return None
     except Exception as e:
         print(f"Error fetching GitHub stats: {e}")
         return None
@@ -102,62 +185,25 @@ def fetch_github_stats_detailed(username: str, github_token: Optional[str] = Non
     """
     if not github_token:
         print("No GitHub token provided, using basic REST API")
-        return fetch_github_stats(username)
-    
-    query = """
-    query($username: String!) {
-      user(login: $username) {
-        login
-        name
-        bio
-        avatarUrl
-        repositories(first: 100, orderBy: {field: UPDATED_AT, direction: DESC}) {
-          totalCount
-          nodes {
-            name
-            primaryLanguage {
-              name
-            }
-            defaultBranchRef {
-              target {
-                ... on Commit {
-                  history {
-                    totalCount
-                  }
-                }
-              }
-            }
-          }
-        }
-        contributionsCollection {
-          totalCommitContributions
-        }
-      }
-    }
-    """
+        return _fetch_github_stats_rest(username)
     
     try:
-        response = requests.post(
-            "https://api.github.com/graphql",
-            json={
-                "query": query,
-                "variables": {"username": username}
-            },
+        response = _SESSION.post(
+            f"{GITHUB_API_BASE}/graphql",
+            data=(_GRAPHQL_PAYLOAD_TEMPLATE % json.dumps(username)).encode('utf-8'),
             headers={
                 "Authorization": f"Bearer {github_token}",
                 "Content-Type": "application/json"
-            }
+            },
+            timeout=_TIMEOUT
         )
         
-        if response.status_code != 200:
-            print(f"GraphQL query failed: {response.status_code}")
-            return fetch_github_stats(username)  # Fallback to REST
-        
-        data = response.json()
+        response.raise_for_status()
+        data = _json_loads(response.content)
         
         if 'errors' in data:
             print(f"GraphQL errors: {data['errors']}")
-            return fetch_github_stats(username)
+            return None
         
         user = data['data']['user']
         repos = user['repositories']['nodes']
@@ -171,7 +217,7 @@ def fetch_github_stats_detailed(username: str, github_token: Optional[str] = Non
         
         top_languages = [
             {"name": lang, "count": count}
-            for lang, count in language_counts.most_common(5)
+            for lang, count in heapq.nlargest(5, language_counts.items(), key=lambda kv: kv[1])
         ]
         
         return {
@@ -180,13 +226,22 @@ def fetch_github_stats_detailed(username: str, github_token: Optional[str] = Non
             "bio": user['bio'],
             "avatar_url": user['avatarUrl'],
             "public_repos": user['repositories']['totalCount'],
+            "followers": user['followers']['totalCount'],
+            "following": user['following']['totalCount'],
+            "created_at": user['createdAt'],
             "total_commits": user['contributionsCollection']['totalCommitContributions'],
             "top_languages": top_languages
         }
         
+    except requests.HTTPError as e:
+        if e.response is not None and e.response.status_code == 401:
+            print("GraphQL authentication failed, using basic REST API")
+            return _fetch_github_stats_rest(username)  # Fallback to REST
+        print(f"GraphQL query failed: {e}")
+        return None
     except Exception as e:
         print(f"Error with GraphQL query: {e}")
-        return fetch_github_stats(username)  # Fallback
+        return None
 
 
 # For testing